@@ -1,5 +1,15 @@
+import asyncio
+import bisect
+import contextlib
+import functools
 import logging
+import math
 import json
+import os
+import time
+from collections import deque
+from collections.abc import Iterator, Sequence
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -16,144 +26,288 @@ from livekit.agents import (
     metrics,
     function_tool,
     RunContext,
+    tokenize,
+    tts,
 )
 from livekit.plugins import silero, google, deepgram, noise_cancellation
 from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
-logger = logging.getLogger("agent")
+from order_log import (
+    LEGACY_ORDERS_FILE,
+    ORDERS_FILE,
+    append_orders,
+    migrate_legacy_orders,
+    rotated_orders_files,
+)
 
-load_dotenv(".env.local")
+logger = logging.getLogger("agent")
 
 # -----------------------------
 # Day 9 – ACP-style E-commerce Agent
 # -----------------------------
 
-ORDERS_FILE = Path("orders_day9.json")
+# How long new orders are buffered before being appended in one batch.
+ORDER_FLUSH_INTERVAL = 0.5
+
+
+@dataclass(slots=True, frozen=True)
+class Product:
+    """Immutable catalog row; slots keep rows small and attribute access fast."""
+
+    id: str
+    name: str
+    description: str
+    price: int
+    currency: str
+    category: str
+    color: str
+    sizes: tuple[str, ...] = ()
+
 
 # Small in-memory catalog (ACP-style: structured objects)
-PRODUCTS: list[dict] = [
-    {
-        "id": "mug-001",
-        "name": "Stoneware Coffee Mug",
-        "description": "Matte finish stoneware mug with a wide handle.",
-        "price": 799,
-        "currency": "INR",
-        "category": "mug",
-        "color": "white",
-        "sizes": [],
-    },
-    {
-        "id": "mug-002",
-        "name": "Travel Coffee Tumbler",
-        "description": "Insulated stainless steel tumbler with lid.",
-        "price": 1199,
-        "currency": "INR",
-        "category": "mug",
-        "color": "black",
-        "sizes": [],
-    },
-    {
-        "id": "tee-001",
-        "name": "Basic Cotton T-shirt",
-        "description": "Unisex cotton t-shirt, regular fit.",
-        "price": 699,
-        "currency": "INR",
-        "category": "tshirt",
-        "color": "black",
-        "sizes": ["S", "M", "L", "XL"],
-    },
-    {
-        "id": "tee-002",
-        "name": "Graphic Tee – Sunset",
-        "description": "Soft tee with minimal sunset print.",
-        "price": 999,
-        "currency": "INR",
-        "category": "tshirt",
-        "color": "white",
-        "sizes": ["S", "M", "L"],
-    },
-    {
-        "id": "hoodie-001",
-        "name": "Cozy Fleece Hoodie",
-        "description": "Pullover hoodie with kangaroo pocket.",
-        "price": 1599,
-        "currency": "INR",
-        "category": "hoodie",
-        "color": "black",
-        "sizes": ["M", "L", "XL"],
-    },
-    {
-        "id": "hoodie-002",
-        "name": "Zip-Up Hoodie",
-        "description": "Lightweight zip hoodie for everyday wear.",
-        "price": 1799,
-        "currency": "INR",
-        "category": "hoodie",
-        "color": "blue",
-        "sizes": ["S", "M", "L"],
-    },
-    {
-        "id": "bottle-001",
-        "name": "Stainless Steel Water Bottle",
-        "description": "750ml insulated bottle, keeps drinks cold.",
-        "price": 899,
-        "currency": "INR",
-        "category": "bottle",
-        "color": "silver",
-        "sizes": [],
-    },
-    {
-        "id": "cap-001",
-        "name": "Minimal Logo Cap",
-        "description": "Adjustable cotton cap with small logo.",
-        "price": 499,
-        "currency": "INR",
-        "category": "cap",
-        "color": "black",
-        "sizes": ["Free"],
-    },
+PRODUCTS: tuple[Product, ...] = (
+    Product(
+        id="mug-001",
+        name="Stoneware Coffee Mug",
+        description="Matte finish stoneware mug with a wide handle.",
+        price=799,
+        currency="INR",
+        category="mug",
+        color="white",
+    ),
+    Product(
+        id="mug-002",
+        name="Travel Coffee Tumbler",
+        description="Insulated stainless steel tumbler with lid.",
+        price=1199,
+        currency="INR",
+        category="mug",
+        color="black",
+    ),
+    Product(
+        id="tee-001",
+        name="Basic Cotton T-shirt",
+        description="Unisex cotton t-shirt, regular fit.",
+        price=699,
+        currency="INR",
+        category="tshirt",
+        color="black",
+        sizes=("S", "M", "L", "XL"),
+    ),
+    Product(
+        id="tee-002",
+        name="Graphic Tee – Sunset",
+        description="Soft tee with minimal sunset print.",
+        price=999,
+        currency="INR",
+        category="tshirt",
+        color="white",
+        sizes=("S", "M", "L"),
+    ),
+    Product(
+        id="hoodie-001",
+        name="Cozy Fleece Hoodie",
+        description="Pullover hoodie with kangaroo pocket.",
+        price=1599,
+        currency="INR",
+        category="hoodie",
+        color="black",
+        sizes=("M", "L", "XL"),
+    ),
+    Product(
+        id="hoodie-002",
+        name="Zip-Up Hoodie",
+        description="Lightweight zip hoodie for everyday wear.",
+        price=1799,
+        currency="INR",
+        category="hoodie",
+        color="blue",
+        sizes=("S", "M", "L"),
+    ),
+    Product(
+        id="bottle-001",
+        name="Stainless Steel Water Bottle",
+        description="750ml insulated bottle, keeps drinks cold.",
+        price=899,
+        currency="INR",
+        category="bottle",
+        color="silver",
+    ),
+    Product(
+        id="cap-001",
+        name="Minimal Logo Cap",
+        description="Adjustable cotton cap with small logo.",
+        price=499,
+        currency="INR",
+        category="cap",
+        color="black",
+        sizes=("Free",),
+    ),
+)
+
+_PRODUCTS_BY_ID: dict[str, Product] = {p.id: p for p in PRODUCTS}
+
+# Lookup indexes over PRODUCTS, built once so filtering doesn't rescan the
+# catalog on every tool call. Values are positions in PRODUCTS.
+_BY_CATEGORY: dict[str, set[int]] = {}
+_BY_COLOR: dict[str, set[int]] = {}
+for _i, _p in enumerate(PRODUCTS):
+    _BY_CATEGORY.setdefault(_p.category.lower(), set()).add(_i)
+    _BY_COLOR.setdefault(_p.color.lower(), set()).add(_i)
+
+_NO_IDS: frozenset[int] = frozenset()
+
+_PRICES_SORTED: list[tuple[float, int]] = sorted(
+    (float(p.price), i) for i, p in enumerate(PRODUCTS)
+)
+_SEARCH_BLOBS: list[str] = [
+    (p.name + " " + p.description + " " + p.category).lower() for p in PRODUCTS
 ]
 
-# Orders will be kept in memory for the session,
-# and persisted to ORDERS_FILE as an ACP-style log.
-ORDERS: list[dict] = []
+# All search blobs joined into one string so a free-text query is a handful of
+# C-level str.find calls instead of a Python loop over every product.
+_SEARCH_SEP = "\x00"
+_SEARCH_TEXT = _SEARCH_SEP.join(_SEARCH_BLOBS)
+_SEARCH_OFFSETS: list[int] = []
+_offset = 0
+for _blob in _SEARCH_BLOBS:
+    _SEARCH_OFFSETS.append(_offset)
+    _offset += len(_blob) + len(_SEARCH_SEP)
+
 
+@functools.lru_cache(maxsize=256)
+def _match_query(q: str) -> frozenset[int]:
+    """Positions in PRODUCTS whose search blob contains the lowercase query.
 
-def _load_orders_from_file() -> list[dict]:
-    if not ORDERS_FILE.exists():
-        return []
+    The catalog is immutable, so results are memoized per query string.
+    """
+    matched: set[int] = set()
+    if not q or _SEARCH_SEP in q:
+        return _NO_IDS
+    pos = _SEARCH_TEXT.find(q)
+    while pos != -1:
+        i = bisect.bisect_right(_SEARCH_OFFSETS, pos) - 1
+        matched.add(i)
+        if i + 1 >= len(_SEARCH_OFFSETS):
+            break
+        # Skip the rest of this product's blob; one hit is enough.
+        pos = _SEARCH_TEXT.find(q, _SEARCH_OFFSETS[i + 1])
+    return frozenset(matched)
+
+
+# The most recent orders are kept in memory (get_last_order only needs the
+# tail); ORDERS_FILE is the durable, append-only JSON Lines log of all orders.
+ORDERS_MAXLEN = 1024
+ORDERS: deque[dict] = deque(maxlen=ORDERS_MAXLEN)
+
+
+def _load_orders_from_file(
+    limit: int | None = None, path: Path | None = None
+) -> Iterator[dict]:
+    """Stream orders from a JSONL log (ORDERS_FILE by default) one line at a time.
+
+    With ``limit``, only the last ``limit`` lines are parsed.
+    """
+    path = path or ORDERS_FILE
     try:
-        with ORDERS_FILE.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            return data
+        with path.open("r", encoding="utf-8") as f:
+            lines = f if limit is None else deque(f, maxlen=limit)
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    logger.warning("Skipping malformed order line in %s: %s", path, e)
+    except FileNotFoundError:
+        return
     except Exception as e:
-        logger.warning(f"Failed to read {ORDERS_FILE}: {e}")
-    return []
+        logger.warning("Failed to read %s: %s", path, e)
 
 
-def _save_orders_to_file():
+def _append_orders_to_file(orders: list[dict]):
+    """Append orders to the shared log; failures are logged, not raised."""
     try:
-        with ORDERS_FILE.open("w", encoding="utf-8") as f:
-            json.dump(ORDERS, f, indent=2, ensure_ascii=False)
-        logger.info(f"Saved {len(ORDERS)} orders to {ORDERS_FILE}")
+        append_orders(orders, ORDERS_FILE)
+        logger.info("Appended %d order(s) to %s", len(orders), ORDERS_FILE)
     except Exception as e:
-        logger.error(f"Failed to write {ORDERS_FILE}: {e}")
+        logger.error("Failed to write %s: %s", ORDERS_FILE, e)
+
 
+class _OrderLogWriter:
+    """
+    Per-job batcher for the order log.
 
-# Initialize orders from file (if any)
-ORDERS.extend(_load_orders_from_file())
+    create_order only hands the order over; a background task appends
+    everything submitted within ORDER_FLUSH_INTERVAL in one write, and
+    aclose() flushes whatever is still pending at shutdown.
+    """
+
+    def __init__(self, flush_interval: float = ORDER_FLUSH_INTERVAL) -> None:
+        self._flush_interval = flush_interval
+        self._pending: list[dict] = []
+        self._has_pending = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def submit(self, order: dict) -> None:
+        self._pending.append(order)
+        self._has_pending.set()
+
+    async def _run(self) -> None:
+        while not self._closing.is_set():
+            await self._has_pending.wait()
+            # Collect orders for one interval, or stop early on close.
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._closing.wait(), self._flush_interval)
+            await self._flush()
+
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        self._has_pending.clear()
+        await asyncio.to_thread(_append_orders_to_file, batch)
+
+    async def aclose(self) -> None:
+        # Let the loop finish any in-flight write instead of cancelling it:
+        # cancellation doesn't stop the worker thread, so a flush started here
+        # could land in the file ahead of the older batch.
+        self._closing.set()
+        self._has_pending.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self._flush()
+
+
+def _restore_orders() -> None:
+    """Fold any legacy JSON orders into the log, then load the newest into ORDERS."""
+    migrate_legacy_orders(ORDERS_FILE, LEGACY_ORDERS_FILE)
+    ORDERS.clear()
+    ORDERS.extend(_load_orders_from_file(limit=ORDERS_MAXLEN))
+    # Right after a rotation the live log is short; backfill the older end
+    # from the newest rotated file so get_last_order keeps its history.
+    missing = ORDERS_MAXLEN - len(ORDERS)
+    if missing > 0:
+        rotated = rotated_orders_files(ORDERS_FILE)
+        if rotated:
+            older = list(_load_orders_from_file(limit=missing, path=rotated[-1]))
+            ORDERS.extendleft(reversed(older))
 
 
 def _build_catalog_block() -> str:
     """Human-readable snapshot for the system prompt."""
-    lines: list[str] = ["CATALOG SNAPSHOT:"]
-    for p in PRODUCTS:
-        lines.append(
-            f"- {p['id']}: {p['name']} "
-            f"(₹{p['price']} {p['currency']}, category: {p['category']}, color: {p['color']})"
-        )
-    return "\n".join(lines)
+    return "CATALOG SNAPSHOT:\n" + "\n".join(
+        f"- {p.id}: {p.name} "
+        f"(₹{p.price} {p.currency}, category: {p.category}, color: {p.color})"
+        for p in PRODUCTS
+    )
 
 
 BASE_INSTRUCTIONS = """
@@ -259,6 +413,10 @@ CONVERSATION STYLE
 IMPORTANT
 --------------------------------
 - Never mention tools, functions, JSON, or ACP by name.
+- Everything you say is spoken aloud: keep each reply to at most 2-3 short
+  sentences (about 40 words). Only product lists and order summaries may run
+  longer, and those should still be as brief as possible.
+- Never use bullet points, markdown, or emojis.
 - Think in terms of:
     "Browsing products" → list_products
     "Placing order" → create_order
@@ -266,8 +424,14 @@ IMPORTANT
 """
 
 
+# The catalog is static, so render the prompt once at import instead of
+# rebuilding it for every session.
+_CATALOG_BLOCK = _build_catalog_block()
+_INSTRUCTIONS = BASE_INSTRUCTIONS.format(catalog_block=_CATALOG_BLOCK)
+
+
 def build_instructions() -> str:
-    return BASE_INSTRUCTIONS.format(catalog_block=_build_catalog_block())
+    return _INSTRUCTIONS
 
 
 class EcommerceAgent(Agent):
@@ -275,42 +439,52 @@ class EcommerceAgent(Agent):
     Day 9 – ACP-inspired E-commerce Agent
     """
 
-    def __init__(self) -> None:
-        super().__init__(instructions=build_instructions())
+    def __init__(self, order_log: _OrderLogWriter) -> None:
+        super().__init__(instructions=_INSTRUCTIONS)
+        self._order_log = order_log
 
-    def _apply_filters(self, filters: dict | None) -> list[dict]:
+    def _apply_filters(self, filters: dict | None) -> Sequence[Product]:
         if not filters:
             return PRODUCTS
 
-        results = PRODUCTS
         category = filters.get("category")
         max_price = filters.get("max_price")
         color = filters.get("color")
         query = filters.get("query")
 
+        # Candidate positions in PRODUCTS; None means "no filter applied yet".
+        # Index sets are only read, never mutated, so they're used without copying.
+        ids: set[int] | frozenset[int] | None = None
+
         if category:
-            category_l = str(category).lower()
-            results = [p for p in results if p["category"].lower() == category_l]
+            ids = _BY_CATEGORY.get(str(category).lower(), _NO_IDS)
+
+        if color and ids != _NO_IDS:
+            matched = _BY_COLOR.get(str(color).lower(), _NO_IDS)
+            ids = matched if ids is None else ids & matched
 
-        if max_price is not None:
+        if max_price is not None and ids != _NO_IDS:
             try:
                 max_p = float(max_price)
-                results = [p for p in results if float(p["price"]) <= max_p]
             except Exception:
-                pass
-
-        if color:
-            color_l = str(color).lower()
-            results = [p for p in results if p["color"].lower() == color_l]
-
-        if query:
-            q = str(query).lower()
-            def matches(p: dict) -> bool:
-                text = (p["name"] + " " + p["description"] + " " + p["category"]).lower()
-                return q in text
-            results = [p for p in results if matches(p)]
-
-        return results
+                max_p = None
+            if max_p is not None:
+                if math.isnan(max_p):
+                    # No price is <= NaN, but bisect would sort it past every price.
+                    ids = _NO_IDS
+                elif ids is None:
+                    cut = bisect.bisect_right(_PRICES_SORTED, (max_p, len(PRODUCTS)))
+                    ids = {i for _, i in _PRICES_SORTED[:cut]}
+                else:
+                    ids = {i for i in ids if float(PRODUCTS[i].price) <= max_p}
+
+        if query and ids != _NO_IDS:
+            matched = _match_query(str(query).lower())
+            ids = matched if ids is None else ids & matched
+
+        if ids is None:
+            return PRODUCTS
+        return [PRODUCTS[i] for i in sorted(ids)]
 
     @function_tool
     async def list_products(
@@ -334,9 +508,14 @@ class EcommerceAgent(Agent):
           }
         """
         results = self._apply_filters(filters or {})
-        logger.info(f"list_products called with filters={filters}, found {len(results)} items")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "list_products called with filters=%r, found %d items",
+                filters,
+                len(results),
+            )
         return {
-            "products": results,
+            "products": [asdict(p) for p in results],
             "count": len(results),
         }
 
@@ -361,7 +540,7 @@ class EcommerceAgent(Agent):
           - Ignores invalid product_ids.
           - Computes total.
           - Generates order_id and created_at.
-          - Appends to ORDERS and persists to JSON file.
+          - Appends to ORDERS and to the JSONL order log.
 
         Returns:
           {
@@ -384,7 +563,9 @@ class EcommerceAgent(Agent):
             }
 
         items: list[dict] = []
-        total = 0.0
+        # Catalog prices are whole rupees; keep order arithmetic in ints so
+        # totals are exact and serialize without float artifacts.
+        total = 0
 
         for li in line_items:
             pid = li.get("product_id")
@@ -398,19 +579,19 @@ class EcommerceAgent(Agent):
             if qty <= 0:
                 continue
 
-            product = next((p for p in PRODUCTS if p["id"] == pid), None)
+            product = _PRODUCTS_BY_ID.get(pid)
             if not product:
-                logger.warning(f"Unknown product_id in line_items: {pid}")
+                logger.warning("Unknown product_id in line_items: %s", pid)
                 continue
 
-            price = float(product["price"])
+            price = product.price
             line_total = price * qty
             total += line_total
 
             items.append(
                 {
-                    "product_id": product["id"],
-                    "name": product["name"],
+                    "product_id": product.id,
+                    "name": product.name,
                     "quantity": qty,
                     "unit_price": price,
                     "line_total": line_total,
@@ -424,8 +605,9 @@ class EcommerceAgent(Agent):
                 "message": "No valid products found in line items.",
             }
 
-        created_at = datetime.now().isoformat()
-        order_id = f"ORD-{int(datetime.now().timestamp())}"
+        now_ns = time.time_ns()
+        order_id = f"ORD-{now_ns // 1_000_000_000}"
+        created_at = datetime.fromtimestamp(now_ns / 1e9).isoformat()
 
         order = {
             "id": order_id,
@@ -436,8 +618,14 @@ class EcommerceAgent(Agent):
         }
 
         ORDERS.append(order)
-        _save_orders_to_file()
-        logger.info(f"Created order {order_id} with {len(items)} items, total={total} {currency}")
+        self._order_log.submit(order)
+        logger.info(
+            "Created order %s with %d items, total=%s %s",
+            order_id,
+            len(items),
+            total,
+            currency,
+        )
 
         return {
             "ok": True,
@@ -470,8 +658,53 @@ class EcommerceAgent(Agent):
 
 
 def prewarm(proc: JobProcess):
+    # Order history is a nicety; a disk problem must not stop the job process
+    # from serving calls, so keep whatever was loaded and carry on.
+    try:
+        _restore_orders()
+    except OSError as e:
+        logger.error("Failed to restore orders from %s: %s", ORDERS_FILE, e)
+
     proc.userdata["vad"] = silero.VAD.load()
 
+    # Build the STT/LLM/TTS clients before a job is assigned so their setup is
+    # paid at process start rather than on room join.
+    # No smart formatting: the LLM doesn't need it and finals arrive sooner.
+    # Punctuation stays on because the turn detector relies on it.
+    proc.userdata["stt"] = deepgram.STT(
+        model="nova-3",
+        interim_results=True,
+        smart_format=False,
+        punctuate=True,
+        endpointing_ms=25,
+    )
+    # Cap reply length so TTS has less to synthesize. Thinking is disabled
+    # because thinking tokens count against max_output_tokens on Gemini 2.5
+    # and add time-to-first-token.
+    proc.userdata["llm"] = google.LLM(
+        model="gemini-2.5-flash",
+        max_output_tokens=160,
+        thinking_config={"thinking_budget": 0},
+    )
+    # GeminiTTS is not a streaming TTS: feed it one sentence at a time so
+    # synthesis of the first sentence overlaps with the rest of the LLM reply.
+    proc.userdata["tts"] = tts.StreamAdapter(
+        tts=google.beta.GeminiTTS(
+            model="gemini-2.5-flash-preview-tts",
+            voice_name="zephyr",  # valid voice
+            instructions=(
+                "Speak like a friendly Indian shopping assistant. "
+                "Keep responses short, clear, and conversational."
+            ),
+        ),
+        # A shorter minimum lets openers like "Sure, let me check." go to TTS
+        # on their own instead of waiting for the next sentence (default is 20).
+        sentence_tokenizer=tokenize.blingfire.SentenceTokenizer(
+            min_sentence_len=10,
+            retain_format=True,
+        ),
+    )
+
 
 async def entrypoint(ctx: JobContext):
     # Logging context
@@ -484,19 +717,15 @@ async def entrypoint(ctx: JobContext):
 
     # Voice pipeline setup
     session = AgentSession(
-        stt=deepgram.STT(model="nova-3"),
-        llm=google.LLM(model="gemini-2.5-flash"),
-        tts=google.beta.GeminiTTS(
-            model="gemini-2.5-flash-preview-tts",
-            voice_name="zephyr",  # valid voice
-            instructions=(
-                "Speak like a friendly Indian shopping assistant. "
-                "Keep responses short, clear, and conversational."
-            ),
-        ),
+        stt=ctx.proc.userdata["stt"],
+        llm=ctx.proc.userdata["llm"],
+        tts=ctx.proc.userdata["tts"],
         turn_detection=MultilingualModel(),
         vad=ctx.proc.userdata["vad"],
-        preemptive_generation=False,
+        # Start the LLM on the interim transcript while the turn is still being
+        # finalized; LiveKit discards the draft if the final text differs.
+        # Set PREEMPTIVE_GENERATION=0 to trade latency for LLM quota.
+        preemptive_generation=os.getenv("PREEMPTIVE_GENERATION", "1") != "0",
     )
 
     # Metrics collection
@@ -508,14 +737,26 @@ async def entrypoint(ctx: JobContext):
         usage_collector.collect(ev.metrics)
 
     async def log_usage():
-        summary = usage_collector.get_summary()
-        logger.info(f"Usage: {summary}")
+        # Don't let metrics reporting hold up worker shutdown.
+        try:
+            summary = await asyncio.wait_for(
+                asyncio.to_thread(usage_collector.get_summary), timeout=2.0
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Timed out collecting usage summary at shutdown")
+            return
+        logger.info("Usage: %s", summary)
 
     ctx.add_shutdown_callback(log_usage)
 
+    # Batched, off-loop order persistence for this job
+    order_log = _OrderLogWriter()
+    order_log.start()
+    ctx.add_shutdown_callback(order_log.aclose)
+
     # Start the EcommerceAgent session
     await session.start(
-        agent=EcommerceAgent(),
+        agent=EcommerceAgent(order_log=order_log),
         room=ctx.room,
         room_input_options=RoomInputOptions(
             noise_cancellation=noise_cancellation.BVC(),
@@ -534,4 +775,6 @@ async def entrypoint(ctx: JobContext):
 
 
 if __name__ == "__main__":
+    # Only the CLI needs .env.local; job processes inherit its environment.
+    load_dotenv(".env.local")
     cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
@@ -1,8 +1,13 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import BackgroundTasks, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel, Field
 import json
+import time
 from datetime import datetime
-from pathlib import Path
+
+from order_log import append_orders, migrate_legacy_orders
 
 CATALOG = [
     {
@@ -31,22 +36,27 @@ CATALOG = [
     },
 ]
 
-ORDERS_FILE = Path("orders_day9.json")
+CATALOG_BY_ID = {p["id"]: p for p in CATALOG}
+
+# The catalog never changes at runtime, so serialize it once instead of
+# re-encoding the list of dicts on every request.
+CATALOG_RESPONSE = json.dumps({"products": CATALOG}, ensure_ascii=False).encode("utf-8")
+
+class LineItem(BaseModel):
+    product_id: str
+    quantity: int = Field(1, ge=1)
 
-def load_orders():
-    if not ORDERS_FILE.exists():
-        return []
-    try:
-        with ORDERS_FILE.open("r") as f:
-            return json.load(f)
-    except:
-        return []
+class OrderPayload(BaseModel):
+    items: list[LineItem] = []
 
-def save_orders(data):
-    with ORDERS_FILE.open("w") as f:
-        json.dump(data, f, indent=2)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs once per server process at startup rather than on import;
+    # migrate_legacy_orders is safe when several workers race on it.
+    migrate_legacy_orders()
+    yield
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -58,10 +68,10 @@ app.add_middleware(
 
 @app.get("/acp/catalog")
 def get_catalog():
-    return {"products": CATALOG}
+    return Response(content=CATALOG_RESPONSE, media_type="application/json")
 
 @app.post("/acp/orders")
-def create_order(payload: dict):
+async def create_order(payload: OrderPayload, background_tasks: BackgroundTasks):
     """
     payload format:
     {
@@ -70,16 +80,13 @@ def create_order(payload: dict):
       ]
     }
     """
-    items = payload.get("items", [])
-    orders = load_orders()
-
     processed_items = []
     total = 0
 
-    for it in items:
-        pid = it["product_id"]
-        qty = int(it.get("quantity", 1))
-        product = next((p for p in CATALOG if p["id"] == pid), None)
+    for it in payload.items:
+        pid = it.product_id
+        qty = it.quantity
+        product = CATALOG_BY_ID.get(pid)
         if product:
             line_total = product["price"] * qty
             total += line_total
@@ -91,15 +98,24 @@ def create_order(payload: dict):
                 "line_total": line_total,
             })
 
+    now_ns = time.time_ns()
     order_obj = {
-        "id": f"ORD-{int(datetime.now().timestamp())}",
+        "id": f"ORD-{now_ns // 1_000_000_000}",
         "items": processed_items,
         "total": total,
         "currency": "INR",
-        "created_at": datetime.now().isoformat(),
+        "created_at": datetime.fromtimestamp(now_ns / 1e9).isoformat(),
     }
 
-    orders.append(order_obj)
-    save_orders(orders)
+    # Persisted after the response is sent; FastAPI runs sync background
+    # tasks in its threadpool, so the event loop never waits on the disk.
+    background_tasks.add_task(append_orders, [order_obj])
 
     return {"ok": True, "order": order_obj}
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # "auto" selects uvloop and httptools when available (uvicorn[standard]),
+    # falling back to asyncio/h11 otherwise. Port matches the frontend.
+    uvicorn.run(app, host="127.0.0.1", port=8000, loop="auto", http="auto")
@@ -0,0 +1,99 @@
+import json
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger("order_log")
+
+# Append-only JSON Lines log shared by the voice agent and the merchant API.
+ORDERS_FILE = Path("orders_day9.jsonl")
+# Pre-JSONL storage: a single JSON list rewritten on every order.
+LEGACY_ORDERS_FILE = Path("orders_day9.json")
+# Size at which the order log is rotated to a timestamped file.
+ORDERS_FILE_MAX_BYTES = 5_000_000
+
+# One reusable encoder: json.dumps() with non-default options builds a new
+# JSONEncoder on every call. Compact separators keep each log line small.
+ORDERS_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# Appends (and rotation) run in worker threads; serialize them within this
+# process. That covers sessions sharing a process (THREAD executor); separate
+# job processes (the default PROCESS executor) and the merchant API are not
+# covered, so rotation tolerates another process having rotated the file first.
+_ORDERS_FILE_LOCK = threading.Lock()
+
+
+def rotated_orders_files(orders_file: Path = ORDERS_FILE) -> list[Path]:
+    """Rotated order logs, oldest first (their timestamps sort chronologically)."""
+    return sorted(orders_file.parent.glob(f"{orders_file.stem}.*{orders_file.suffix}"))
+
+
+def _rotate_if_needed(orders_file: Path) -> None:
+    """Move a full order log aside so it, and startup parsing, stay bounded.
+
+    Rotated logs are never deleted; they hold the order history.
+    """
+    try:
+        size = orders_file.stat().st_size
+    except FileNotFoundError:
+        return
+    if size < ORDERS_FILE_MAX_BYTES:
+        return
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    rotated = orders_file.with_name(f"{orders_file.stem}.{stamp}{orders_file.suffix}")
+    try:
+        orders_file.rename(rotated)
+    except FileNotFoundError:
+        # Another process rotated it between our stat and rename.
+        return
+    logger.info("Rotated %s to %s (%d bytes)", orders_file, rotated, size)
+
+
+def append_orders(orders: list[dict], orders_file: Path = ORDERS_FILE) -> None:
+    """Append orders as JSON lines in a single write; cost is independent of history size."""
+    data = "".join(ORDERS_ENCODER.encode(o) + "\n" for o in orders).encode("utf-8")
+    with _ORDERS_FILE_LOCK:
+        try:
+            _rotate_if_needed(orders_file)
+        except OSError as e:
+            # A failed rotation only leaves the log large; still write the orders.
+            logger.warning("Failed to rotate %s: %s", orders_file, e)
+        with orders_file.open("ab") as f:
+            f.write(data)
+
+
+def migrate_legacy_orders(
+    orders_file: Path = ORDERS_FILE,
+    legacy_file: Path = LEGACY_ORDERS_FILE,
+) -> int:
+    """
+    Move orders from the legacy JSON list into the JSONL log, once.
+
+    The legacy file is claimed by renaming it to ``*.json.migrated`` before it
+    is read, so when several processes start together only one of them copies
+    the orders; the others see it already gone and do nothing.
+
+    Returns the number of orders appended.
+    """
+    migrated = legacy_file.with_suffix(".json.migrated")
+    try:
+        legacy_file.rename(migrated)
+    except FileNotFoundError:
+        # Never existed, or another process already migrated it.
+        return 0
+
+    try:
+        legacy = json.loads(migrated.read_bytes())
+    except ValueError as e:
+        logger.error("Could not parse %s, left as %s: %s", legacy_file, migrated, e)
+        return 0
+
+    if not isinstance(legacy, list) or not legacy:
+        return 0
+
+    append_orders(legacy, orders_file)
+    logger.info(
+        "Migrated %d order(s) from %s to %s", len(legacy), legacy_file, orders_file
+    )
+    return len(legacy)
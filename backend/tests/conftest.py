@@ -0,0 +1,4 @@
+from dotenv import load_dotenv
+
+# agent.py only loads .env.local when run as a script; evals need the same keys.
+load_dotenv(".env.local")
@@ -0,0 +1,99 @@
+import itertools
+
+import pytest
+
+from agent import PRODUCTS, EcommerceAgent, _OrderLogWriter
+
+CATEGORIES = [None, "", "mug", "MUG", "Hoodie", "tshirt", "sofa"]
+COLORS = [None, "", "black", "White", "BLUE", "purple"]
+MAX_PRICES = [
+    None,
+    0,
+    499,
+    699.0,
+    "1000",
+    1599.5,
+    -1,
+    "cheap",
+    float("inf"),
+    "-inf",
+    float("nan"),
+    "nan",
+]
+QUERIES = [
+    None,
+    "",
+    "coffee",
+    "HOODIE",
+    "Tee",
+    "cotton t",
+    "mug",
+    "steel",
+    "zzz",
+    "tumbler with lid",
+    "\x00",
+]
+
+
+def _reference_filter(filters: dict) -> list[str]:
+    """Straightforward per-product scan; the indexed path must agree with it."""
+    results = list(PRODUCTS)
+    category = filters.get("category")
+    max_price = filters.get("max_price")
+    color = filters.get("color")
+    query = filters.get("query")
+
+    if category:
+        results = [p for p in results if p.category.lower() == str(category).lower()]
+    if max_price is not None:
+        try:
+            max_p = float(max_price)
+        except ValueError:
+            max_p = None
+        if max_p is not None:
+            results = [p for p in results if float(p.price) <= max_p]
+    if color:
+        results = [p for p in results if p.color.lower() == str(color).lower()]
+    if query:
+        q = str(query).lower()
+        results = [
+            p
+            for p in results
+            if q in (p.name + " " + p.description + " " + p.category).lower()
+        ]
+    return [p.id for p in results]
+
+
+@pytest.fixture(scope="module")
+def shop() -> EcommerceAgent:
+    return EcommerceAgent(order_log=_OrderLogWriter())
+
+
+def test_no_filters_returns_catalog(shop: EcommerceAgent) -> None:
+    assert [p.id for p in shop._apply_filters(None)] == [p.id for p in PRODUCTS]
+    assert [p.id for p in shop._apply_filters({})] == [p.id for p in PRODUCTS]
+
+
+def test_filters_match_reference(shop: EcommerceAgent) -> None:
+    """Every combination of the edge values above agrees with the plain scan."""
+    mismatches = []
+    for category, color, max_price, query in itertools.product(
+        CATEGORIES, COLORS, MAX_PRICES, QUERIES
+    ):
+        filters = {
+            "category": category,
+            "color": color,
+            "max_price": max_price,
+            "query": query,
+        }
+        got = [p.id for p in shop._apply_filters(filters)]
+        expected = _reference_filter(filters)
+        if got != expected:
+            mismatches.append((filters, got, expected))
+    assert not mismatches, mismatches[:5]
+
+
+def test_query_matches_each_product_once(shop: EcommerceAgent) -> None:
+    """A query hitting several fields of one product yields that product once."""
+    got = [p.id for p in shop._apply_filters({"query": "hoodie"})]
+    assert got == ["hoodie-001", "hoodie-002"]
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+import agent
+
+
+@pytest.fixture
+def orders_file(tmp_path, monkeypatch):
+    path = tmp_path / "orders_day9.jsonl"
+    monkeypatch.setattr(agent, "ORDERS_FILE", path)
+    return path
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Record the order ids of every batch handed to the file appender."""
+    seen: list[list[str]] = []
+    append = agent._append_orders_to_file
+
+    def recording_append(orders: list[dict]) -> None:
+        seen.append([o["id"] for o in orders])
+        append(orders)
+
+    monkeypatch.setattr(agent, "_append_orders_to_file", recording_append)
+    return seen
+
+
+def _ids_in_file(path) -> list[str]:
+    return [json.loads(line)["id"] for line in path.read_text().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_batches_orders_within_interval(orders_file, batches) -> None:
+    """Orders submitted within one interval are appended in a single write."""
+    writer = agent._OrderLogWriter(flush_interval=0.05)
+    writer.start()
+    for order_id in ("ORD-1", "ORD-2", "ORD-3"):
+        writer.submit({"id": order_id})
+
+    await asyncio.sleep(0.2)
+
+    assert batches == [["ORD-1", "ORD-2", "ORD-3"]]
+    assert _ids_in_file(orders_file) == ["ORD-1", "ORD-2", "ORD-3"]
+    await writer.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_flushes_pending_orders(orders_file, batches) -> None:
+    """Shutdown writes pending orders without waiting out the interval."""
+    writer = agent._OrderLogWriter(flush_interval=30)
+    writer.start()
+    writer.submit({"id": "ORD-1"})
+    writer.submit({"id": "ORD-2"})
+
+    await asyncio.wait_for(writer.aclose(), timeout=2)
+
+    assert batches == [["ORD-1", "ORD-2"]]
+    assert _ids_in_file(orders_file) == ["ORD-1", "ORD-2"]
+
+
+@pytest.mark.asyncio
+async def test_aclose_keeps_order_with_flush_in_flight(
+    orders_file, monkeypatch
+) -> None:
+    """A batch being written at shutdown still lands before later orders."""
+    append = agent._append_orders_to_file
+    first_write_started = threading.Event()
+
+    def slow_first_append(orders: list[dict]) -> None:
+        if not first_write_started.is_set():
+            first_write_started.set()
+            time.sleep(0.2)
+        append(orders)
+
+    monkeypatch.setattr(agent, "_append_orders_to_file", slow_first_append)
+
+    writer = agent._OrderLogWriter(flush_interval=0.01)
+    writer.start()
+    writer.submit({"id": "ORD-1"})
+    await asyncio.to_thread(first_write_started.wait, 2)
+    writer.submit({"id": "ORD-2"})
+
+    await writer.aclose()
+
+    assert _ids_in_file(orders_file) == ["ORD-1", "ORD-2"]
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+import agent
+import order_log
+
+
+@pytest.fixture
+def orders_file(tmp_path, monkeypatch):
+    path = tmp_path / "orders_day9.jsonl"
+    monkeypatch.setattr(agent, "ORDERS_FILE", path)
+    monkeypatch.setattr(agent, "LEGACY_ORDERS_FILE", tmp_path / "orders_day9.json")
+    yield path
+    agent.ORDERS.clear()
+
+
+def _write_orders(path, ids) -> None:
+    path.write_text("".join(json.dumps({"id": i}) + "\n" for i in ids))
+
+
+def test_restore_backfills_from_newest_rotated_log(orders_file) -> None:
+    """After a rotation, startup still sees the orders that were rotated away."""
+    _write_orders(
+        orders_file.with_name("orders_day9.20260101-000000-000000.jsonl"), ["A"]
+    )
+    _write_orders(
+        orders_file.with_name("orders_day9.20260102-000000-000000.jsonl"), ["B", "C"]
+    )
+    _write_orders(orders_file, ["D"])
+
+    agent._restore_orders()
+
+    assert [o["id"] for o in agent.ORDERS] == ["B", "C", "D"]
+
+
+def test_restore_without_live_log(orders_file) -> None:
+    _write_orders(
+        orders_file.with_name("orders_day9.20260102-000000-000000.jsonl"), ["B"]
+    )
+
+    agent._restore_orders()
+
+    assert [o["id"] for o in agent.ORDERS] == ["B"]
+
+
+def test_rotation_keeps_all_history(orders_file, monkeypatch) -> None:
+    """Rotation never deletes older logs."""
+    monkeypatch.setattr(order_log, "ORDERS_FILE_MAX_BYTES", 1)
+
+    for i in range(5):
+        agent._append_orders_to_file([{"id": f"ORD-{i}"}])
+
+    rotated = order_log.rotated_orders_files(orders_file)
+    assert [json.loads(p.read_text())["id"] for p in rotated] == [
+        "ORD-0",
+        "ORD-1",
+        "ORD-2",
+        "ORD-3",
+    ]
+    assert json.loads(orders_file.read_text())["id"] == "ORD-4"
+
+
+def test_append_survives_concurrent_rotation(orders_file, monkeypatch) -> None:
+    """If another process rotates the log first, the batch is still written."""
+    monkeypatch.setattr(order_log, "ORDERS_FILE_MAX_BYTES", 1)
+    _write_orders(orders_file, ["ORD-0"])
+    rename = type(orders_file).rename
+
+    def rotated_elsewhere(self, target):
+        rename(self, self.with_name("orders_day9.20260101-000000-000000.jsonl"))
+        return rename(self, target)
+
+    monkeypatch.setattr(type(orders_file), "rename", rotated_elsewhere)
+    agent._append_orders_to_file([{"id": "ORD-1"}])
+
+    assert json.loads(orders_file.read_text())["id"] == "ORD-1"
+
+
+def test_append_survives_failed_rotation(orders_file, monkeypatch) -> None:
+    monkeypatch.setattr(order_log, "ORDERS_FILE_MAX_BYTES", 1)
+    _write_orders(orders_file, ["ORD-0"])
+
+    def denied(self, target):
+        raise PermissionError("denied")
+
+    monkeypatch.setattr(type(orders_file), "rename", denied)
+    agent._append_orders_to_file([{"id": "ORD-1"}])
+
+    ids = [json.loads(line)["id"] for line in orders_file.read_text().splitlines()]
+    assert ids == ["ORD-0", "ORD-1"]